@@ -42,7 +42,7 @@ async def test_agent_with_model(model_name, agent):
     logger.info("")
 
     logger.info("Invoking agent...")
-    result = agent.invoke({
+    result = await agent.ainvoke({
         "messages": [
             {"role": "user", "content": TEST_QUERY}
         ]